@@ -1,10 +1,194 @@
-from sentence_transformers import SentenceTransformer
 import numpy as np
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Dynamically quantized (INT8) ONNX export shipped with the sentence-transformers models
+DEFAULT_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Number of text embeddings kept per generator, keyed by content hash
+EMBEDDING_CACHE_SIZE = 4096
+
+# Length of the blake2b content hash used as cache key
+CACHE_KEY_BYTES = 16
 
 class EmbeddingGenerator:
-    def __init__(self, model_name="all-MiniLM-L6-v2"):
-        self.model = SentenceTransformer(model_name)
+    # Every embedding is L2-normalized, so cosine similarity is a plain dot product
+    normalized = True
+
+    def __init__(self, model_name="all-MiniLM-L6-v2", backend="onnx", onnx_file=DEFAULT_ONNX_FILE,
+                 cache_dtype=np.float16):
+        """
+        Args:
+            model_name: SentenceTransformer model to load
+            backend: "onnx" runs the INT8 ONNX export through ONNX Runtime,
+                "torch" runs the original FP32 PyTorch model
+            onnx_file: ONNX file inside the model repo used by the onnx backend
+            cache_dtype: Precision of cached and saved embeddings. float16 halves
+                their memory and file size; results are returned as float32
+                either way, rounded to this precision so cache hits and misses agree.
+        """
+        self.cache_dtype = cache_dtype
+        self.model_name = model_name
+        # The backend that actually loaded: onnx silently falls back to torch
+        self.model, self.backend = _load_sentence_transformer(model_name, backend, onnx_file)
+        self.onnx_file = onnx_file if self.backend == "onnx" else ""
+        
+        # Embeddings by content hash, so unchanged CVs are not re-encoded for every JD
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def generate_embeddings(self, text):
-        """Convert text to embeddings."""
-        return self.model.encode(text)
\ No newline at end of file
+        """Convert text to a unit-norm embedding."""
+        if not isinstance(text, str):
+            return self.model.encode(text, normalize_embeddings=True)
+        
+        key = self._cache_key(text)
+        with self._cache_lock:
+            cached = self._cache_lookup(key)
+        if cached is None:
+            embedding = self.model.encode(text, normalize_embeddings=True)
+            with self._cache_lock:
+                cached = self._cache_store(key, embedding)
+        return cached.astype(np.float32)
+
+    def generate_embeddings_batch(self, texts, batch_size=32):
+        """Convert a list of texts to an (n, dim) matrix of unit-norm embeddings in padded batches.
+        Texts embedded before are served from the cache; only new ones are encoded."""
+        if not texts:
+            return self._encode_batch(texts, batch_size)
+        
+        keys = [self._cache_key(text) for text in texts]
+        with self._cache_lock:
+            rows = [self._cache_lookup(key) for key in keys]
+        
+        # Encode each missing text once, even if it appears several times
+        missing = {}
+        for i, row in enumerate(rows):
+            if row is None:
+                missing.setdefault(keys[i], i)
+        if missing:
+            encoded = self._encode_batch([texts[i] for i in missing.values()], batch_size)
+            with self._cache_lock:
+                fresh = {key: self._cache_store(key, embedding) for key, embedding in zip(missing, encoded)}
+            rows = [fresh[key] if row is None else row for key, row in zip(keys, rows)]
+        
+        return np.vstack(rows).astype(np.float32, copy=False)
+
+    def _encode_batch(self, texts, batch_size):
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+
+    @staticmethod
+    def _cache_key(text):
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=CACHE_KEY_BYTES).digest()
+
+    def _cache_lookup(self, key):
+        """Cached embedding or None; caller holds _cache_lock"""
+        embedding = self._cache.get(key)
+        if embedding is not None:
+            self._cache.move_to_end(key)
+        return embedding
+
+    def _cache_store(self, key, embedding):
+        """Store a cache_dtype copy of embedding and return it; caller holds _cache_lock"""
+        stored = np.array(embedding, dtype=self.cache_dtype, copy=True)
+        self._cache[key] = stored
+        self._cache.move_to_end(key)
+        if len(self._cache) > EMBEDDING_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return stored
+
+    def clear_cache(self):
+        """Drop all cached embeddings"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cache_identity(self):
+        """(model_name, backend, onnx_file) that produced this generator's embeddings;
+        embeddings from different models or backends are not comparable"""
+        return (self.model_name, self.backend, self.onnx_file)
+
+    def save_cache(self, path):
+        """Write cached embeddings to an .npz file"""
+        with self._cache_lock:
+            keys = list(self._cache)
+            vectors = list(self._cache.values())
+        np.savez(
+            path,
+            model_name=np.array(self.model_name),
+            backend=np.array(self.backend),
+            onnx_file=np.array(self.onnx_file),
+            keys=np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(len(keys), CACHE_KEY_BYTES),
+            vectors=np.vstack(vectors) if vectors else np.empty((0, 0), dtype=self.cache_dtype)
+        )
+
+    def load_cache(self, path):
+        """Add embeddings saved by save_cache; files from another model or backend are ignored"""
+        try:
+            with np.load(path) as data:
+                saved = tuple(
+                    str(data[name]) if name in data.files else None
+                    for name in ("model_name", "backend", "onnx_file")
+                )
+                if saved != self._cache_identity():
+                    logger.warning(f"Embedding cache {path} was built with {saved}, ignoring it")
+                    return
+                entries = list(zip(data["keys"], data["vectors"]))
+        except FileNotFoundError:
+            return
+        with self._cache_lock:
+            for key, embedding in entries:
+                self._cache_store(key.tobytes(), embedding)
+
+
+_model_lock = threading.Lock()
+
+
+def load_sentence_transformer(model_name="all-MiniLM-L6-v2", backend="onnx", onnx_file=DEFAULT_ONNX_FILE):
+    """SentenceTransformer loaded once per process for each (model, backend, file)"""
+    return _load_sentence_transformer(model_name, backend, onnx_file)[0]
+
+
+def _load_sentence_transformer(model_name, backend, onnx_file):
+    """(SentenceTransformer, backend it was actually loaded with)"""
+    with _model_lock:
+        return _cached_sentence_transformer(model_name, backend, onnx_file)
+
+
+@lru_cache(maxsize=None)
+def _cached_sentence_transformer(model_name, backend, onnx_file):
+    # Imported here so importing this module does not pull in torch
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "onnx":
+        try:
+            return SentenceTransformer(
+                model_name, backend="onnx", model_kwargs={"file_name": onnx_file}
+            ), "onnx"
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable for {model_name}, using PyTorch: {e}")
+    return SentenceTransformer(model_name), "torch"
+
+
+_generator_lock = threading.Lock()
+
+
+def get_embedding_generator(model_name="all-MiniLM-L6-v2", backend="onnx"):
+    """Shared EmbeddingGenerator per (model_name, backend), loaded on first use"""
+    with _generator_lock:
+        return _cached_embedding_generator(model_name, backend)
+
+
+@lru_cache(maxsize=None)
+def _cached_embedding_generator(model_name, backend):
+    return EmbeddingGenerator(model_name=model_name, backend=backend)
@@ -1,15 +1,111 @@
 import re
+import copy
 import spacy
 import nltk
-from typing import Dict, List, Any, Optional
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 import logging
+import threading
+from functools import lru_cache
 from app.services.extractor.llm_extractor import LLMExtractor
-# Download required NLTK data
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+from app.services.extractor.keyword_matcher import (
+    KeywordMatcher, SKILL_KEYWORDS, CERTIFICATION_KEYWORDS, DEGREE_KEYWORDS, DOMAIN_KEYWORDS
+)
 
 logger = logging.getLogger(__name__)
 
+# Only NER (PERSON / GPE) is used. In en_core_web_sm the ner component has its
+# own embedding layer, so the shared tok2vec and everything feeding the tagger
+# and parser can be left out entirely.
+SPACY_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# NLTK resources (download name, data path) the extractor expects
+NLTK_RESOURCES = (('punkt', 'tokenizers/punkt'), ('stopwords', 'corpora/stopwords'))
+
+# Bump whenever extraction output changes, so results persisted by callers are invalidated
+EXTRACTOR_VERSION = 1
+
+# Number of CV extraction results kept per extractor, keyed by content hash
+CV_CACHE_SIZE = 256
+
+# CV names are looked for by NER in this many leading characters first; the
+# whole text is only tagged when no name is found well before the cut
+NAME_NER_PREFIX_CHARS = 1000
+NAME_NER_MARGIN_CHARS = 200
+
+
+def _term_pattern(term: str) -> str:
+    """Regex for a literal, possibly multi-word term with flexible whitespace"""
+    return r'\s+'.join(re.escape(word) for word in term.split())
+
+
+# Every regex is compiled once at import and shared by all extractors. Pattern
+# lists whose captures can overlap stay separate so results are unchanged.
+
+# Same degree names as the keyword scan, which gates this pattern
+_DEGREE_RE = re.compile(
+    rf"\b(?:{'|'.join(re.escape(d) for d in DEGREE_KEYWORDS)})\b.*?\b(?:in\s+)?([A-Za-z\s]+)", re.I
+)
+_REQUIRED_DEGREE_RE = re.compile(
+    r'\b(?:Bachelor|Master|PhD|BSc|MSc|MBA|CA|ACCA)\b.*?\b(?:in\s+)?([A-Za-z\s]+)', re.I
+)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = tuple(re.compile(p) for p in (
+    r'(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}',
+    r'Cell[:\s]*([\d\-\+\(\)\s]+)',
+    r'Phone[:\s]*([\d\-\+\(\)\s]+)',
+))
+# Literal each phone pattern needs, so a pass is skipped when it cannot match
+_PHONE_TRIGGERS = (None, 'Cell', 'Phone')
+# Patterns whose output does not depend on case run case-sensitively
+# over the document's lowercased copy
+_EXPERIENCE_RE = re.compile(r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)')
+_PROJECT_RES = tuple(re.compile(p, re.I) for p in (
+    r'\b(?:Project|Developed|Built):?\s*([A-Za-z0-9\s\-_]+)',
+    r'\b(?:Led|Managed)\s+([A-Za-z0-9\s\-_]+)\s+(?:project|initiative)\b'
+))
+_REQUIRED_SKILL_RES = tuple(re.compile(p, re.I) for p in (
+    r'\b(?:Required|Must have|Essential):?\s*([A-Za-z0-9\s,]+)',
+    r'\b(?:Skills|Technologies):?\s*([A-Za-z0-9\s,]+)',
+    r'\b(?:Experience with|Knowledge of)\s+([A-Za-z0-9\s,]+)\b'
+))
+_REQUIRED_EXPERIENCE_RES = tuple(re.compile(p) for p in (
+    r'\b(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)\s+(?:required|needed)\b',
+    r'\b(?:minimum|at least)\s+(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)\b'
+))
+_REQUIREMENT_RES = tuple(re.compile(p, re.I) for p in (
+    r'\b(?:Requirements|Qualifications|Must have)\s*:?\s*([A-Za-z0-9\s,\.]+)',
+    r'•\s*([A-Za-z0-9\s,\.]+)',
+    r'-\s*([A-Za-z0-9\s,\.]+)'
+))
+# All domain terms in one pattern with a named group per domain, for
+# callers that need the domain but not the other keyword hits (terms match
+# as written, with single spaces)
+_DOMAIN_RE = re.compile("|".join(
+    rf"(?P<{domain}>\b(?:{'|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True))})\b)"
+    for domain, terms in DOMAIN_KEYWORDS.items()
+))
+_DOMAIN_PRIORITY = {domain: rank for rank, domain in enumerate(DOMAIN_KEYWORDS)}
+# Multi-word certifications may have any whitespace between their words, as
+# in the original patterns, so they are matched here instead of by the
+# single-spaced keyword scan (lowercased text -> canonical spelling)
+_SPACED_CERTS = {cert.lower(): cert for cert in CERTIFICATION_KEYWORDS if ' ' in cert}
+_SPACED_CERT_RE = re.compile(rf"\b(?:{'|'.join(_term_pattern(c) for c in _SPACED_CERTS)})\b")
+
+# Every character str.splitlines breaks lines on (\r\n is \r then \n)
+_LINE_BREAKS = r'\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029'
+# Lines of 2-4 words that each start with a letter other than a-z; the
+# few candidates are confirmed with str.isupper in _extract_name
+_NAME_LINE_RE = re.compile(
+    rf'(?:^|(?<=[{_LINE_BREAKS}]))[^\S{_LINE_BREAKS}]*'
+    rf'([^\W\d_a-z]\S*(?:[^\S{_LINE_BREAKS}]+[^\W\d_a-z]\S*){{1,3}})'
+    rf'[^\S{_LINE_BREAKS}]*(?=[{_LINE_BREAKS}]|\Z)'
+)
+_STRICT_REQUIREMENTS_RE = re.compile(r'\b(?:ca|acca|cpa)\s+(?:required|mandatory)\b')
+_JOB_DESCRIPTION_RE = re.compile(r'\b(?:job\s*description|requirements|qualifications)\b')
+
+
 class InformationExtractor:
     def __init__(self, use_llm_fallback=True, llm_api_key=None):
         """
@@ -18,22 +114,16 @@ class InformationExtractor:
             use_llm_fallback: Whether to use LLM when regex extraction fails
             llm_api_key: Gemini API key for better LLM extraction
         """
-        spacy_model = 'en_core_web_sm'
-        try:
-            self.nlp = spacy.load(spacy_model)
-        except OSError:
-            logger.warning(f"Spacy model {spacy_model} not found. Installing...")
-            spacy.cli.download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
+        ensure_nltk_data()
+        self.nlp = load_spacy_model('en_core_web_sm')
         
-        # Enhanced skill patterns with domain identifiers
-        self.skill_patterns = [
-            r'\b(?:Python|Java|C\+\+|TensorFlow|PyTorch|Scikit-learn)\b',
-            r'\b(?:Machine Learning|Deep Learning|Computer Vision|NLP)\b',
-            r'\b(?:IFRS|GAAP|ISA|Audit|Taxation|Financial Reporting)\b',
-            r'\b(?:ACCA|CA|CPA|Chartered Accountant)\b',
-            r'\b(?:Excel|QuickBooks|SAP|Oracle|ERP)\b'
-        ]
+        # Skill, certification and domain vocabularies share one keyword automaton
+        self._keyword_matcher = KeywordMatcher({
+            "skill": {skill.lower(): [skill] for skill in SKILL_KEYWORDS},
+            "certification": {cert: [cert] for cert in CERTIFICATION_KEYWORDS if cert.lower() not in _SPACED_CERTS},
+            "domain": DOMAIN_KEYWORDS,
+            "degree": {degree.lower(): [degree] for degree in DEGREE_KEYWORDS},
+        })
         
         # Education patterns
         self.education_patterns = [
@@ -47,51 +137,153 @@ class InformationExtractor:
         if use_llm_fallback:
             self.llm_extractor = LLMExtractor(api_key=llm_api_key)
 
+        # Extraction results by content hash; the same CV is often ranked against several JDs
+        self._cv_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cv_cache_lock = threading.Lock()
+
     def extract_cv_information(self, text: str) -> Dict[str, Any]:
         """Extract information from CV text with LLM fallback"""
+        return self._extract_cv_information(text)
+
+    def _extract_cv_information(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        key = self._content_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result, complete = self._extract_cv_from_doc(text, self.nlp(self._name_prefix(text)), text_lower)
+        return self._cache_put(key, result) if complete else result
+
+    def extract_many(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """Extract information from several CV texts, running spaCy over them in batches"""
+        keys = [self._content_key(text) for text in texts]
+        results = [self._cache_get(key) for key in keys]
+        
+        # Only texts not seen before go through the spaCy pipeline
+        pending = [i for i, result in enumerate(results) if result is None]
+        docs = self.nlp.pipe((self._name_prefix(texts[i]) for i in pending), batch_size=batch_size, n_process=1)
+        extracted = {i: self._extract_cv_regex(texts[i], doc) for i, doc in zip(pending, docs)}
+        
+        # CVs needing the LLM fallback are sent to Gemini concurrently
+        incomplete = set()
+        if self.use_llm_fallback:
+            fallback = [i for i in pending if self._should_use_llm_fallback(extracted[i])]
+            if fallback:
+                logger.info(f"Using LLM fallback for {len(fallback)} CVs")
+                llm_results = self.llm_extractor.extract_fields_batch([texts[i] for i in fallback])
+                for i, llm_result in zip(fallback, llm_results):
+                    extracted[i] = self._merge_llm_result(extracted[i], llm_result)
+                    if self._llm_call_failed(llm_result):
+                        incomplete.add(i)
+        
+        for i in pending:
+            results[i] = extracted[i] if i in incomplete else self._cache_put(keys[i], extracted[i])
+        return results
+
+    @property
+    def llm_available(self) -> bool:
+        """Whether CV extraction can actually fall back to Gemini"""
+        return self.use_llm_fallback and self.llm_extractor.gemini_available
+
+    def is_cached(self, text: str) -> bool:
+        """Whether the extraction result for text is held in the cache. Results of a
+        failed LLM fallback are not, so callers persisting results can skip them too."""
+        key = self._content_key(text)
+        with self._cv_cache_lock:
+            return key in self._cv_cache
+
+    @staticmethod
+    def _content_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Copy of a cached extraction result, or None"""
+        with self._cv_cache_lock:
+            result = self._cv_cache.get(key)
+            if result is None:
+                return None
+            self._cv_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_put(self, key: bytes, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an extraction result and return a copy the caller may modify"""
+        with self._cv_cache_lock:
+            self._cv_cache[key] = result
+            self._cv_cache.move_to_end(key)
+            if len(self._cv_cache) > CV_CACHE_SIZE:
+                self._cv_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def _name_prefix(text: str) -> str:
+        """Leading part of a CV for name NER, cut at whitespace"""
+        if len(text) <= NAME_NER_PREFIX_CHARS:
+            return text
+        cut = max(text.rfind(' ', 0, NAME_NER_PREFIX_CHARS), text.rfind('\n', 0, NAME_NER_PREFIX_CHARS))
+        return text[:cut] if cut > 0 else text[:NAME_NER_PREFIX_CHARS]
+
+    def _extract_cv_from_doc(self, text: str, doc, text_lower: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+        """CV extraction for text whose spaCy doc has already been built
+        (for the whole text or the prefix from _name_prefix), and whether
+        the result is complete enough to cache"""
         # First try regex-based extraction
-        doc = self.nlp(text)
-        experience = self._extract_experience(text)
+        regex_result = self._extract_cv_regex(text, doc, text_lower)
         
-        regex_result = {
+        # Check if we need LLM fallback
+        if self.use_llm_fallback and self._should_use_llm_fallback(regex_result):
+            logger.info("Using LLM fallback for CV extraction")
+            llm_result = self.llm_extractor.extract_fields(text)
+            return self._merge_llm_result(regex_result, llm_result), not self._llm_call_failed(llm_result)
+        
+        return regex_result, True
+
+    def _llm_call_failed(self, llm_result: Dict[str, Any]) -> bool:
+        """True when Gemini was available but returned nothing (rate limit, network,
+        unparsable answer); such results are retried later instead of cached"""
+        return not llm_result and self.llm_extractor.gemini_available
+
+    def _extract_cv_regex(self, text: str, doc, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Regex/keyword/NER part of CV extraction"""
+        if text_lower is None:
+            text_lower = text.lower()
+        experience = self._extract_experience(text_lower)
+        keywords = self._keyword_matcher.scan(text_lower, already_lower=True)
+        
+        return {
             "name": self._extract_name(doc, text),
             "email": self._extract_email(text),
             "phone": self._extract_phone(text),
-            "skills": self._extract_skills(text),
+            "skills": self._extract_skills(text, keywords),
             "years_of_experience": experience[0]["total_years"] if experience else 0,
-            "domain": self._infer_domain(text),
-            "education": self._extract_education_details(text),
-            "certifications": self._extract_certifications(text),
+            "domain": self._infer_domain(text_lower, keywords),
+            "education": self._extract_education_details(text, keywords),
+            "certifications": self._extract_certifications(text, keywords, text_lower),
             "projects": self._extract_projects(text)
         }
-        
-        # Check if we need LLM fallback
-        if self.use_llm_fallback and self._should_use_llm_fallback(regex_result):
-            logger.info("Using LLM fallback for CV extraction")
-            llm_result = self.llm_extractor.extract_fields(text)
-            
-            # Merge results, preferring LLM for missing fields
-            merged_result = regex_result.copy()
-            for key, value in llm_result.items():
-                if not regex_result.get(key) or (isinstance(value, list) and len(value) > len(regex_result.get(key, []))):
-                    merged_result[key] = value
-            
-            return merged_result
-        
-        return regex_result
+
+    @staticmethod
+    def _merge_llm_result(regex_result: Dict[str, Any], llm_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge results, preferring LLM for missing fields"""
+        merged_result = regex_result.copy()
+        for key, value in llm_result.items():
+            if not regex_result.get(key) or (isinstance(value, list) and len(value) > len(regex_result.get(key, []))):
+                merged_result[key] = value
+        return merged_result
 
     def extract_job_information(self, text: str) -> Dict[str, Any]:
         """Extract information from job description with LLM fallback"""
+        return self._extract_job_information(text, text.lower())
+
+    def _extract_job_information(self, text: str, text_lower: str) -> Dict[str, Any]:
         # First try regex-based extraction
         doc = self.nlp(text)
         req_edu = self._extract_required_education(text)
         
         regex_result = {
             "required_skills": self._extract_required_skills(text),
-            "min_experience": self._extract_required_experience(text) or 0,
+            "min_experience": self._extract_required_experience(text_lower) or 0,
             "required_education": req_edu,
-            "strict_requirements": self._has_strict_requirements(text),
-            "domain": self._infer_domain(text),
+            "strict_requirements": self._has_strict_requirements(text_lower),
+            "domain": self._infer_domain(text_lower),
             "location": self._extract_location(doc),
             "requirements": self._extract_requirements(text)
         }
@@ -112,53 +304,39 @@ class InformationExtractor:
         return regex_result
 
     # ===== DOMAIN-SPECIFIC METHODS =====
-    def _infer_domain(self, text: str) -> str:
-        text_lower = text.lower()
-    
-    # 1. Accounting/Audit detection
-        accounting_terms = [
-            'audit', 'accounting', 'ifrs', 'isa', 'acca', 'ca', 'cpa', 
-            'financial report', 'chartered accountant', 'taxation',
-            'financial statement', 'auditing standards', 'gaap'
-        ]
-        if any(re.search(rf'\b{term}\b', text_lower) for term in accounting_terms):
-           return "accounting"
-    
-    # 2. AI/ML detection with higher priority for specific terms
-        ml_terms = [
-            'machine learning', 'computer vision', 'ai\b', 'neural network',
-            'deep learning', 'tensorflow', 'pytorch', 'data science',
-            'reinforcement learning', 'image recognition'
-        ]
-        if any(re.search(rf'\b{term}\b', text_lower) for term in ml_terms):
-            return "ai_ml"
-    
-    # 3. Engineering fields
-        engineering_terms = {
-           'electrical': ['electrical', 'circuit', 'pcb', 'power systems'],
-           'mechanical': ['mechanical', 'cad', 'thermodynamics'],
-           'software': ['software', 'developer', 'programming']
-          }
-        for domain, terms in engineering_terms.items():
-             if any(re.search(rf'\b{term}\b', text_lower) for term in terms):
-                return f"engineering_{domain}"
-    
-        return "general"
-    
-    def _has_strict_requirements(self, text: str) -> bool:
-
-        """Check if JD has strict qualification requirements"""
-        return bool(re.search(r'\b(?:CA|ACCA|CPA)\s+(?:required|mandatory)\b', text, re.I))
+    def _infer_domain(self, text_lower: str, keywords: Optional[Dict[str, set]] = None) -> str:
+        """Infer domain (expects lowercased text); accounting > AI/ML > engineering"""
+        if keywords is not None:
+            found = keywords["domain"]
+            for domain in DOMAIN_KEYWORDS:
+                if domain in found:
+                    return domain
+            return "general"
+
+        # Single pass over the domain pattern, stopping at a top-priority hit
+        best = None
+        for match in _DOMAIN_RE.finditer(text_lower):
+            domain = match.lastgroup
+            if best is None or _DOMAIN_PRIORITY[domain] < _DOMAIN_PRIORITY[best]:
+                best = domain
+                if _DOMAIN_PRIORITY[best] == 0:
+                    break
+        return best or "general"
+
+    def _has_strict_requirements(self, text_lower: str) -> bool:
+
+        """Check if JD has strict qualification requirements (expects lowercased text)"""
+        return bool(_STRICT_REQUIREMENTS_RE.search(text_lower))
 
     # ===== EDUCATION EXTRACTION =====
-    def _extract_education_details(self, text: str) -> List[str]:
+    def _extract_education_details(self, text: str, keywords: Optional[Dict[str, set]] = None) -> List[str]:
         """Get detailed education information from CV"""
         education = []
+        # Without a degree name anywhere the degree pattern cannot match
+        if keywords is not None and not keywords["degree"]:
+            return education
         # Extract degrees
-        degree_matches = re.finditer(
-            r'\b(?:Bachelor|BSc|Master|MSc|MBA|PhD|B\.Tech|M\.Tech)\b.*?\b(?:in\s+)?([A-Za-z\s]+)',
-            text, re.I
-        )
+        degree_matches = _DEGREE_RE.finditer(text)
         education.extend(match.group(0).strip() for match in degree_matches if match.group(1).strip())
         return education
 
@@ -166,112 +344,101 @@ class InformationExtractor:
         """Extract required education from job description"""
         education = []
         # Look for education requirements
-        matches = re.finditer(
-            r'\b(?:Bachelor|Master|PhD|BSc|MSc|MBA|CA|ACCA)\b.*?\b(?:in\s+)?([A-Za-z\s]+)',
-            text, re.I
-        )
+        matches = _REQUIRED_DEGREE_RE.finditer(text)
         education.extend(match.group(0).strip() for match in matches if match.group(1).strip())
         return education
 
     # ===== CORE EXTRACTION METHODS =====
     def _extract_name(self, doc, text) -> Optional[str]:
         """Extract person name using NER"""
+        truncated = len(doc.text) < len(text)
         for ent in doc.ents:
             if ent.label_ == "PERSON":
+                # An entity close to the cut may be tagged differently with full context
+                if truncated and ent.end_char > len(doc.text) - NAME_NER_MARGIN_CHARS:
+                    break
                 return ent.text.strip()
-        for line in text.splitlines():
-            line = line.strip()
-            if line and len(line.split()) in [2, 3, 4] and all(w[0].isupper() for w in line.split() if w):
+        if truncated:
+            for ent in self.nlp(text).ents:
+                if ent.label_ == "PERSON":
+                    return ent.text.strip()
+        for match in _NAME_LINE_RE.finditer(text):
+            line = match.group(1)
+            if all(w[0].isupper() for w in line.split()):
                 return line
         return None
 
     def _extract_email(self, text: str) -> Optional[str]:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        # A substring test is far cheaper than trying the pattern at every position
+        if '@' not in text:
+            return None
+        match = _EMAIL_RE.search(text)
         return match.group() if match else None
 
     def _extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number"""
-        phone_patterns = [
-            r'(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}',
-            r'Cell[:\s]*([\d\-\+\(\)\s]+)',
-            r'Phone[:\s]*([\d\-\+\(\)\s]+)',
-        ]
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
+        for pattern, trigger in zip(_PHONE_RES, _PHONE_TRIGGERS):
+            if trigger is not None and trigger not in text:
+                continue
+            match = pattern.search(text)
             if match:
                 return match.group().strip()
         return None
 
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: str, keywords: Optional[Dict[str, set]] = None) -> List[str]:
         """Extract skills from text"""
-        skills = set()
-        for pattern in self.skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.update([match.lower() for match in matches])
-        return list(skills)
-
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
-        """Extract experience details"""
+        if keywords is None:
+            keywords = self._keyword_matcher.scan(text)
+        return list(keywords["skill"])
+
+    def _extract_experience(self, text_lower: str) -> List[Dict[str, Any]]:
+        """Extract experience details (expects lowercased text)"""
         experience = []
-        exp_pattern = r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)'
-        matches = re.findall(exp_pattern, text, re.IGNORECASE)
+        if 'exp' not in text_lower:
+            return experience
+        matches = _EXPERIENCE_RE.findall(text_lower)
         if matches:
             total_years = max([int(match) for match in matches])
             experience.append({"total_years": total_years})
         return experience
 
-    def _extract_certifications(self, text: str) -> List[str]:
+    def _extract_certifications(self, text: str, keywords: Optional[Dict[str, set]] = None,
+                                text_lower: Optional[str] = None) -> List[str]:
         """Extract certifications with proper word boundaries"""
-        cert_patterns = [
-           r'\bAWS\s+Certified\b',
-           r'\bAzure\s+Certified\b',
-           r'\bGCP\s+Certified\b',
-           r'\bPMP\b', r'\bCISSP\b', r'\bCCNA\b', r'\bCCNP\b', r'\bCEH\b', r'\bCompTIA\b',
-           r'\bCA\b', r'\bACCA\b', r'\bCPA\b'
-        ]
-        certifications = []
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            certifications.extend([match.strip() for match in matches if match.strip()])
-        return list(set(certifications))
+        if text_lower is None:
+            text_lower = text.lower()
+        if keywords is None:
+            keywords = self._keyword_matcher.scan(text_lower, already_lower=True)
+        certifications = set(keywords["certification"])
+        if 'certified' in text_lower:
+            certifications.update(
+                _SPACED_CERTS[' '.join(match.group().split())] for match in _SPACED_CERT_RE.finditer(text_lower)
+            )
+        return list(certifications)
 
     def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
         """Extract project information"""
         projects = []
-        project_patterns = [
-            r'\b(?:Project|Developed|Built):?\s*([A-Za-z0-9\s\-_]+)',
-            r'\b(?:Led|Managed)\s+([A-Za-z0-9\s\-_]+)\s+(?:project|initiative)\b'
-        ]
-        for pattern in project_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            projects.extend({"name": match.strip()} for match in matches if match.strip())
+        for pattern in _PROJECT_RES:
+            names = filter(None, (match.strip() for match in pattern.findall(text)))
+            projects.extend({"name": name} for name in names)
         return projects
 
     def _extract_required_skills(self, text: str) -> List[str]:
         """Extract required skills from job description"""
-        required_skills = []
-        required_patterns = [
-            r'\b(?:Required|Must have|Essential):?\s*([A-Za-z0-9\s,]+)',
-            r'\b(?:Skills|Technologies):?\s*([A-Za-z0-9\s,]+)',
-            r'\b(?:Experience with|Knowledge of)\s+([A-Za-z0-9\s,]+)\b'
-        ]
-        for pattern in required_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skills = [skill.strip() for skill in match.split(',')]
-                required_skills.extend(skills)
-        return list(set(required_skills))
-
-    def _extract_required_experience(self, text: str) -> Optional[int]:
-        """Extract required years of experience"""
-        exp_patterns = [
-            r'\b(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)\s+(?:required|needed)\b',
-            r'\b(?:Minimum|At least)\s+(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)\b'
-        ]
-        for pattern in exp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        required_skills = set()
+        for pattern in _REQUIRED_SKILL_RES:
+            for match in pattern.findall(text):
+                required_skills.update(skill.strip() for skill in match.split(','))
+        return list(required_skills)
+
+    def _extract_required_experience(self, text_lower: str) -> Optional[int]:
+        """Extract required years of experience (expects lowercased text)"""
+        if 'exp' not in text_lower:
+            return None
+        for pattern in _REQUIRED_EXPERIENCE_RES:
+            match = pattern.search(text_lower)
             if match:
                 return int(match.group(1))
         return None
@@ -286,21 +453,17 @@ class InformationExtractor:
     def _extract_requirements(self, text: str) -> List[str]:
         """Extract general requirements"""
         requirements = []
-        req_patterns = [
-            r'\b(?:Requirements|Qualifications|Must have)\s*:?\s*([A-Za-z0-9\s,\.]+)',
-            r'•\s*([A-Za-z0-9\s,\.]+)',
-            r'-\s*([A-Za-z0-9\s,\.]+)'
-        ]
-        for pattern in req_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            requirements.extend([match.strip() for match in matches if match.strip()])
+        for pattern in _REQUIREMENT_RES:
+            requirements.extend(filter(None, (match.strip() for match in pattern.findall(text))))
         return requirements
 
     def extract(self, text: str) -> Dict[str, Any]:
         """Unified extraction method"""
-        if self._is_job_description(text):
-            return self.extract_job_information(text)
-        return self.extract_cv_information(text)
+        # Lowercase once for both the JD check and the extraction that follows
+        text_lower = text.lower()
+        if self._is_job_description(text_lower):
+            return self._extract_job_information(text, text_lower)
+        return self._extract_cv_information(text, text_lower)
 
     def _should_use_llm_fallback(self, extracted_data: Dict[str, Any]) -> bool:
         """Determine if LLM fallback should be used based on extraction quality"""
@@ -317,6 +480,49 @@ class InformationExtractor:
         missing_ratio = missing_fields / total_fields if total_fields > 0 else 0
         return missing_ratio > 0.05
 
-    def _is_job_description(self, text: str) -> bool:
-        """Detect if text is a job description"""
-        return bool(re.search(r'\b(?:job\s*description|requirements|qualifications)\b', text, re.I))
\ No newline at end of file
+    def _is_job_description(self, text_lower: str) -> bool:
+        """Detect if text is a job description (expects lowercased text)"""
+        return bool(_JOB_DESCRIPTION_RE.search(text_lower))
+
+
+_extractor_lock = threading.Lock()
+
+
+def get_information_extractor(use_llm_fallback: bool = True, llm_api_key: Optional[str] = None) -> InformationExtractor:
+    """Shared InformationExtractor per configuration, built on first use"""
+    with _extractor_lock:
+        return _cached_information_extractor(use_llm_fallback, llm_api_key)
+
+
+@lru_cache(maxsize=None)
+def _cached_information_extractor(use_llm_fallback: bool, llm_api_key: Optional[str]) -> InformationExtractor:
+    return InformationExtractor(use_llm_fallback=use_llm_fallback, llm_api_key=llm_api_key)
+
+
+@lru_cache(maxsize=1)
+def ensure_nltk_data() -> None:
+    """Download required NLTK data if missing, once per process"""
+    for resource, path in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(resource, quiet=True)
+
+
+_spacy_lock = threading.Lock()
+
+
+def load_spacy_model(spacy_model: str = 'en_core_web_sm'):
+    """spaCy pipeline loaded once per process and shared by all extractors"""
+    with _spacy_lock:
+        return _cached_spacy_model(spacy_model)
+
+
+@lru_cache(maxsize=None)
+def _cached_spacy_model(spacy_model: str):
+    try:
+        return spacy.load(spacy_model, exclude=SPACY_EXCLUDE)
+    except OSError:
+        logger.warning(f"Spacy model {spacy_model} not found. Installing...")
+        spacy.cli.download(spacy_model)
+        return spacy.load(spacy_model, exclude=SPACY_EXCLUDE)
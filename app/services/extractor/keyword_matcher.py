@@ -0,0 +1,123 @@
+import re
+import logging
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Skill vocabulary (reported lowercased)
+SKILL_KEYWORDS = (
+    "Python", "Java", "C++", "TensorFlow", "PyTorch", "Scikit-learn",
+    "Machine Learning", "Deep Learning", "Computer Vision", "NLP",
+    "IFRS", "GAAP", "ISA", "Audit", "Taxation", "Financial Reporting",
+    "ACCA", "CA", "CPA", "Chartered Accountant",
+    "Excel", "QuickBooks", "SAP", "Oracle", "ERP",
+)
+
+# Certifications (reported in the canonical spelling below)
+CERTIFICATION_KEYWORDS = (
+    "AWS Certified", "Azure Certified", "GCP Certified",
+    "PMP", "CISSP", "CCNA", "CCNP", "CEH", "CompTIA",
+    "CA", "ACCA", "CPA",
+)
+
+# Degree names that open an education entry
+DEGREE_KEYWORDS = ("Bachelor", "BSc", "Master", "MSc", "MBA", "PhD", "B.Tech", "M.Tech")
+
+# Domain indicator terms, in priority order (first domain with a hit wins)
+DOMAIN_KEYWORDS = {
+    "accounting": [
+        'audit', 'accounting', 'ifrs', 'isa', 'acca', 'ca', 'cpa',
+        'financial report', 'chartered accountant', 'taxation',
+        'financial statement', 'auditing standards', 'gaap'
+    ],
+    "ai_ml": [
+        # Bare 'ai' is not a term: a plain "AI" has never marked a CV as ai_ml
+        'machine learning', 'computer vision', 'neural network',
+        'deep learning', 'tensorflow', 'pytorch', 'data science',
+        'reinforcement learning', 'image recognition'
+    ],
+    "engineering_electrical": ['electrical', 'circuit', 'pcb', 'power systems'],
+    "engineering_mechanical": ['mechanical', 'cad', 'thermodynamics'],
+    "engineering_software": ['software', 'developer', 'programming'],
+}
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """Whole-word, case-insensitive matcher for several keyword vocabularies at once.
+
+    All vocabularies are compiled into a single Aho-Corasick automaton, so a
+    document is scanned once no matter how many keywords there are. Falls back
+    to one compiled regex alternation when pyahocorasick is not installed.
+    Multi-word keywords match only as written, with single spaces.
+    """
+
+    def __init__(self, vocabularies: Dict[str, Dict[str, Iterable[str]]]):
+        """
+        Args:
+            vocabularies: category -> {label: [surface forms]}. Every hit of a
+                surface form is reported as its label under that category.
+        """
+        self.categories = list(vocabularies)
+        # normalized surface -> [(category, label), ...]
+        self._surfaces: Dict[str, List[Tuple[str, str]]] = {}
+        for category, labels in vocabularies.items():
+            for label, surfaces in labels.items():
+                for surface in surfaces:
+                    key = self.normalize(surface)
+                    self._surfaces.setdefault(key, []).append((category, label))
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for surface, targets in self._surfaces.items():
+                self._automaton.add_word(surface, (len(surface), targets))
+            self._automaton.make_automaton()
+            self._regex = None
+        else:
+            logger.warning("pyahocorasick not installed - falling back to regex keyword matching")
+            self._automaton = None
+            alternation = "|".join(
+                re.escape(s) for s in sorted(self._surfaces, key=len, reverse=True)
+            )
+            self._regex = re.compile(rf"\b(?:{alternation})\b")
+
+    @staticmethod
+    def normalize(surface: str) -> str:
+        """Lowercase a keyword and collapse its whitespace runs to single spaces"""
+        return " ".join(surface.lower().split())
+
+    def scan(self, text: str, already_lower: bool = False) -> Dict[str, Set[str]]:
+        """Return {category: set of labels} for every keyword found in text.
+        Pass already_lower=True when text has already been lowercased."""
+        hits = {category: set() for category in self.categories}
+        if not already_lower:
+            text = text.lower()
+        for targets in self._iter_targets(text):
+            for category, label in targets:
+                hits[category].add(label)
+        return hits
+
+    def _iter_targets(self, text: str):
+        """(category, label) lists of every whole-word keyword hit"""
+        if self._automaton is None:
+            for match in self._regex.finditer(text):
+                yield self._surfaces[match.group()]
+            return
+
+        last = len(text) - 1
+        for end, (length, targets) in self._automaton.iter(text):
+            start = end - length + 1
+            # Same semantics as regex \b on both sides of the keyword
+            if _is_word_char(text[start]) == (start > 0 and _is_word_char(text[start - 1])):
+                continue
+            if _is_word_char(text[end]) == (end < last and _is_word_char(text[end + 1])):
+                continue
+            yield targets
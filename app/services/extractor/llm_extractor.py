@@ -3,11 +3,19 @@
 import json
 import logging
 import os
-from typing import Dict, Any, Optional
-import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Gemini models to try, in order of preference
+GEMINI_MODEL_NAMES = ('gemini-1.5-pro', 'gemini-1.5-flash', 'gemini-pro')
+
+# Gemini requests kept in flight at once by extract_fields_batch
+LLM_CONCURRENCY = 8
+
+_JSON_DECODER = json.JSONDecoder()
+
 class LLMExtractor:
     def __init__(self, api_key=None, use_gemini=True):
         """
@@ -19,6 +27,8 @@ class LLMExtractor:
         self.api_key = api_key
         self.use_gemini = use_gemini
         self.gemini_available = False
+        # (name, GenerativeModel) pairs built once and reused for every request
+        self._models = []
         
         # Initialize Gemini
         if use_gemini:
@@ -39,6 +49,7 @@ class LLMExtractor:
                 
                 if gemini_api_key:
                     genai.configure(api_key=gemini_api_key)
+                    self._models = [(name, genai.GenerativeModel(name)) for name in GEMINI_MODEL_NAMES]
                     self.gemini_available = True
                     logger.info("✓ Using Google Gemini with API key")
                 else:
@@ -69,37 +80,64 @@ class LLMExtractor:
     def _extract_with_gemini(self, resume_text: str) -> Dict[str, Any]:
         """Extract using Google Gemini API"""
         try:
-            import google.generativeai as genai
-            
             prompt = self._create_extraction_prompt(resume_text)
             
-            # Try different models in order of preference
-            model_names = ['gemini-1.5-pro', 'gemini-1.5-flash', 'gemini-pro']
-            
-            for model_name in model_names:
-                try:
-                    model = genai.GenerativeModel(model_name)
-                    response = model.generate_content(prompt)
-                    result_text = response.text
-                    return self._parse_llm_response(result_text)
-                except Exception as e:
-                    error_msg = str(e)
-                    if "404" in error_msg:
-                        logger.warning(f"Model {model_name} not found, trying next...")
-                        continue
-                    else:
-                        raise e
+            return self._generate_with_fallback(prompt)
             
         except Exception as e:
-            error_msg = str(e)
-            if "429" in error_msg or "quota" in error_msg.lower():
-                logger.warning(f"Gemini rate limit/quota exceeded: {error_msg[:100]}...")
-            elif "404" in error_msg:
-                logger.error(f"Gemini model not found: {error_msg[:100]}...")
-            else:
-                logger.error(f"Gemini extraction failed: {error_msg}")
+            self._log_gemini_error(e, "extraction")
             return {}
 
+    def extract_fields_batch(self, resume_texts: List[str],
+                             concurrency: int = LLM_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        Extract several resumes with up to `concurrency` Gemini requests in flight.
+        Results are in input order; a failed resume yields {}.
+        """
+        if not resume_texts:
+            return []
+        if not self.gemini_available:
+            logger.warning("No LLM available for extraction")
+            return [{} for _ in resume_texts]
+        
+        # Blocking calls on a thread pool: Gemini requests wait on the network,
+        # and the sync client is not tied to an event loop that a later call lacks
+        workers = min(len(resume_texts), concurrency)
+        if workers <= 1:
+            return [self.extract_fields(text) for text in resume_texts]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_fields, resume_texts))
+
+    def _generate_with_fallback(self, prompt: str) -> Dict[str, Any]:
+        """Run prompt on the first available model and parse its JSON answer"""
+        for model_name, model in self._models:
+            try:
+                response = model.generate_content(prompt)
+                result_text = response.text
+                return self._parse_llm_response(result_text)
+            except Exception as e:
+                error_msg = str(e)
+                if "404" in error_msg:
+                    logger.warning(f"Model {model_name} not found, trying next...")
+                    # Don't try a missing model again on later requests
+                    self._models = [m for m in self._models if m[0] != model_name]
+                    continue
+                else:
+                    raise e
+        
+        logger.warning("No Gemini model available for extraction")
+        return {}
+
+    @staticmethod
+    def _log_gemini_error(e: Exception, task: str):
+        error_msg = str(e)
+        if "429" in error_msg or "quota" in error_msg.lower():
+            logger.warning(f"Gemini rate limit/quota exceeded: {error_msg[:100]}...")
+        elif "404" in error_msg:
+            logger.error(f"Gemini model not found: {error_msg[:100]}...")
+        else:
+            logger.error(f"Gemini {task} failed: {error_msg}")
+
     def _create_extraction_prompt(self, resume_text: str) -> str:
         """Create a structured prompt for extraction"""
         return f"""
@@ -130,11 +168,12 @@ Return only the JSON object:
     def _parse_llm_response(self, response_text: str) -> Dict[str, Any]:
         """Parse LLM response and extract JSON"""
         try:
-            # Find JSON in response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                return json.loads(json_str)
+            # Parse the JSON object starting at the first brace; raw_decode stops at
+            # its matching close brace, so prose around it is ignored
+            start = response_text.find('{')
+            if start != -1:
+                result, _ = _JSON_DECODER.raw_decode(response_text, start)
+                return result
             else:
                 logger.warning("No JSON found in LLM response")
                 return {}
@@ -159,8 +198,6 @@ Return only the JSON object:
     def _extract_job_with_gemini(self, job_text: str) -> Dict[str, Any]:
         """Extract job requirements using Gemini"""
         try:
-            import google.generativeai as genai
-            
             prompt = f"""
 You are an expert job requirement parser. Extract job requirements from this job description and return ONLY valid JSON.
 
@@ -180,29 +217,8 @@ Job description:
 Return only the JSON object:
 """
             
-            # Try different models in order of preference
-            model_names = ['gemini-1.5-pro', 'gemini-1.5-flash', 'gemini-pro']
-            
-            for model_name in model_names:
-                try:
-                    model = genai.GenerativeModel(model_name)
-                    response = model.generate_content(prompt)
-                    result_text = response.text
-                    return self._parse_llm_response(result_text)
-                except Exception as e:
-                    error_msg = str(e)
-                    if "404" in error_msg:
-                        logger.warning(f"Model {model_name} not found, trying next...")
-                        continue
-                    else:
-                        raise e
+            return self._generate_with_fallback(prompt)
             
         except Exception as e:
-            error_msg = str(e)
-            if "429" in error_msg or "quota" in error_msg.lower():
-                logger.warning(f"Gemini rate limit/quota exceeded: {error_msg[:100]}...")
-            elif "404" in error_msg:
-                logger.error(f"Gemini model not found: {error_msg[:100]}...")
-            else:
-                logger.error(f"Gemini job extraction failed: {error_msg}")
+            self._log_gemini_error(e, "job extraction")
             return {}
@@ -1,11 +1,27 @@
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Dict, List, Tuple, Union, Any
+from typing import Dict, List, Tuple, Union, Any, Optional
+import numpy as np
 from pprint import pprint
+import heapq
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from app.services.extractor.keyword_matcher import SKILL_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
+# One bit per known skill, so Jaccard over known skills is a popcount
+SKILL_TO_BIT = {skill.lower(): 1 << i for i, skill in enumerate(SKILL_KEYWORDS)}
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+# Certifications that satisfy a strict accounting requirement
+ACCOUNTING_CERTS = frozenset({'ca', 'acca', 'cpa'})
+
 class SemanticMatcher:
     def __init__(self, weights: Dict[str, float] = None):
         self.weights = weights or {
@@ -22,11 +38,26 @@ class SemanticMatcher:
             'engineering': ['accounting'],
             'general': []  # General can match with anything
         }
+        
+        # Incompatible (domain, domain) pairs in both orders, and a memo of
+        # each domain string's rule key (e.g. engineering_software -> engineering)
+        self._incompatible_pairs = frozenset(
+            pair
+            for domain, incompatible in self.incompatible_domains.items()
+            for other in incompatible
+            for pair in ((domain, other), (other, domain))
+        )
+        self._domain_keys: Dict[str, Optional[str]] = {}
 
     def match(self, resume_embedding: List[float], jd_embedding: List[float], 
-              resume_data: Dict[str, Any], jd_data: Dict[str, Any]) -> Dict[str, Any]:
+              resume_data: Dict[str, Any], jd_data: Dict[str, Any],
+              base_score: Optional[float] = None,
+              prepared_jd: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Enhanced matching with strict domain checks and weighted scoring
+        Enhanced matching with strict domain checks and weighted scoring.
+        Pass base_score when the cosine similarity was already computed
+        (e.g. vectorized in rank_candidates) to skip recomputing it, and
+        prepared_jd (from _prepare_jd) to reuse per-JD work across resumes.
         Returns: {
             "score": weighted match score (0-1),
             "details": {
@@ -40,11 +71,15 @@ class SemanticMatcher:
         """
         try:
             # Calculate base embedding similarity
-            base_score = cosine_similarity([resume_embedding], [jd_embedding])[0][0]
+            if base_score is None:
+                base_score = self._cosine_scores([resume_embedding], jd_embedding)[0]
+            
+            if prepared_jd is None:
+                prepared_jd = self._prepare_jd(jd_data)
             
             # Get domains
             resume_domain = resume_data.get("domain", "general")
-            jd_domain = jd_data.get("domain", "general")
+            jd_domain = prepared_jd["domain"]
             
             # Strict domain compatibility check
             domain_match = self._check_domain_compatibility(resume_domain, jd_domain)
@@ -62,13 +97,32 @@ class SemanticMatcher:
                 }
             
             # Calculate component matches
-            skills_match = self._calculate_skills_match(
+            skills_match = self._skills_jaccard(
                 resume_data.get("skills", []),
-                jd_data.get("required_skills", [])
+                prepared_jd["skills"],
+                prepared_jd["skills_mask"]
             )
             
-            education_match = self._check_education(resume_data, jd_data)
-            experience_match = self._check_experience(resume_data, jd_data)
+            # Same rules as _check_education / _check_experience, using the prepared JD
+            education_match = 1.0
+            if prepared_jd["accounting_certs_required"]:
+                resume_edu = " ".join(resume_data.get("education", [])).lower()
+                if not (any(c.lower() in ACCOUNTING_CERTS for c in resume_data.get("certifications", []))
+                        or any(term in resume_edu for term in ACCOUNTING_CERTS)):
+                    education_match = 0.0
+            
+            # Experience compares the domains without the "general" default;
+            # with both domains present that is the check that already passed
+            experience_domains = (resume_data.get("domain", ""), prepared_jd["experience_domain"])
+            jd_min_exp = prepared_jd["min_experience"]
+            if (experience_domains != (resume_domain, jd_domain)
+                    and not self._check_domain_compatibility(*experience_domains)):
+                experience_match = 0.0
+            elif jd_min_exp == 0:
+                experience_match = 1.0
+            else:
+                resume_exp = resume_data.get("years_of_experience", 0)
+                experience_match = 1.0 if resume_exp >= jd_min_exp else 0.5 * (resume_exp / jd_min_exp)
             
             # Calculate weighted score
             weighted_score = (
@@ -102,27 +156,81 @@ class SemanticMatcher:
                 }
             }
 
+    def _prepare_jd(self, jd_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-JD values that stay the same for every resume being matched"""
+        return {
+            "domain": jd_data.get("domain", "general"),
+            "experience_domain": jd_data.get("domain", ""),
+            "skills": frozenset(s.lower() for s in jd_data.get("required_skills", [])),
+            "skills_mask": self._skills_mask(jd_data.get("required_skills", [])),
+            "min_experience": jd_data.get("min_experience", 0),
+            "accounting_certs_required": bool(jd_data.get("strict_requirements", False))
+                                         and jd_data.get("domain", "") == "accounting"
+        }
+
+    @staticmethod
+    def _skills_mask(skills: List[str]) -> Optional[int]:
+        """Bitmask of known skills, or None if any skill is outside SKILL_TO_BIT"""
+        mask = 0
+        for skill in skills:
+            bit = SKILL_TO_BIT.get(skill.lower())
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
+
+    @staticmethod
+    def _cosine_scores(embeddings: Any, jd_embedding: Any, normalized: bool = False) -> np.ndarray:
+        """Cosine similarity of every embedding row against the JD embedding in one matmul.
+        Pass normalized=True when the rows are already unit-norm."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        jd_vec = np.asarray(jd_embedding, dtype=np.float32).ravel()
+        dots = matrix @ jd_vec
+        jd_norm = np.float32(np.linalg.norm(jd_vec))
+        if normalized:
+            return dots / (jd_norm if jd_norm else np.float32(1.0))
+        norms = (np.linalg.norm(matrix, axis=1) * jd_norm).astype(np.float32)
+        norms[norms == 0] = 1.0  # zero vectors score 0, as in sklearn
+        return dots / norms
+
     def _check_domain_compatibility(self, resume_domain: str, jd_domain: str) -> bool:
         """Strict domain compatibility check with exact matching"""
         if resume_domain == jd_domain:
             return True
-            
+        
         # Check explicit incompatibility rules
-        for domain, incompatible in self.incompatible_domains.items():
-            if jd_domain.startswith(domain):
-                return not any(resume_domain.startswith(d) for d in incompatible)
-            if resume_domain.startswith(domain):
-                return not any(jd_domain.startswith(d) for d in incompatible)
-                
-        return False  # Default to False for unknown combinations
+        resume_key = self._domain_key(resume_domain)
+        jd_key = self._domain_key(jd_domain)
+        if resume_key is None and jd_key is None:
+            return False  # Default to False for unknown combinations
+        return (resume_key, jd_key) not in self._incompatible_pairs
+
+    def _domain_key(self, domain: str) -> Optional[str]:
+        """Rule key in incompatible_domains that domain starts with, if any"""
+        try:
+            return self._domain_keys[domain]
+        except KeyError:
+            key = next((k for k in self.incompatible_domains if domain.startswith(k)), None)
+            self._domain_keys[domain] = key
+            return key
 
     def _calculate_skills_match(self, resume_skills: List[str], jd_skills: List[str]) -> float:
         """Calculate Jaccard similarity between skill sets"""
-        if not jd_skills:
+        return self._skills_jaccard(resume_skills, frozenset(s.lower() for s in jd_skills))
+
+    def _skills_jaccard(self, resume_skills: List[str], jd_set: frozenset,
+                        jd_mask: Optional[int] = None) -> float:
+        """Jaccard similarity against an already-lowercased JD skill set"""
+        if not jd_set:
             return 0.0
+        
+        # Bitmask fast path when both sides only use known skills
+        if jd_mask is not None:
+            resume_mask = self._skills_mask(resume_skills)
+            if resume_mask is not None:
+                return _popcount(resume_mask & jd_mask) / _popcount(resume_mask | jd_mask)
             
         resume_set = {s.lower() for s in resume_skills}
-        jd_set = {s.lower() for s in jd_skills}
         
         intersection = len(resume_set & jd_set)
         union = len(resume_set | jd_set)
@@ -139,10 +247,9 @@ class SemanticMatcher:
           resume_edu = " ".join(resume_data.get("education", [])).lower()
         
         # Check for required accounting certifications
-          required_certs = {'ca', 'acca', 'cpa'}
-          if any(c in required_certs for c in resume_certs):
+          if any(c in ACCOUNTING_CERTS for c in resume_certs):
              return 1.0
-          if any(term in resume_edu for term in required_certs):
+          if any(term in resume_edu for term in ACCOUNTING_CERTS):
              return 1.0
             
           return 0.0
@@ -189,13 +296,43 @@ class SemanticMatcher:
        }
 
     def rank_candidates(self, resumes: List[Dict[str, Any]], jd_embedding: List[float], 
-                       jd_data: Dict[str, Any], embedder: Any) -> List[Tuple[float, Dict[str, Any], Dict[str, Any]]]:
-        """Rank candidates by match score"""
+                       jd_data: Dict[str, Any], embedder: Any,
+                       max_workers: Optional[int] = None,
+                       top_k: Optional[int] = None) -> List[Tuple[float, Dict[str, Any], Dict[str, Any]]]:
+        """Rank candidates by match score
+
+        max_workers bounds the threads used to embed resumes one at a time when
+        the embedder has no batch API (defaults to the CPU count).
+        top_k returns only the best k candidates, selected without sorting them all.
+        """
         ranked = []
-        for resume in resumes:
+        if not resumes:
+            return ranked
+
+        contents = [resume.get("content", "") for resume in resumes]
+        embeddings = self._embed_resumes(embedder, contents, max_workers)
+        # Resumes that failed to embed are skipped, like any other resume error
+        embedded = [i for i, emb in enumerate(embeddings) if emb is not None]
+        if not embedded:
+            return ranked
+        try:
+            # Unit-norm resume embeddings need no per-row norm in the cosine
+            base_scores = self._cosine_scores([embeddings[i] for i in embedded], jd_embedding,
+                                              normalized=getattr(embedder, "normalized", False))
+        except Exception as e:
+            logger.error(f"Error scoring resume embeddings: {str(e)}")
+            base_scores = [None] * len(embedded)  # match() computes or reports it per resume
+        try:
+            prepared_jd = self._prepare_jd(jd_data)
+        except Exception as e:
+            logger.error(f"Error preparing job description: {str(e)}")
+            prepared_jd = None  # match() reports the error per resume
+
+        for i, base_score in zip(embedded, base_scores):
+            resume, emb = resumes[i], embeddings[i]
             try:
-                emb = embedder.generate_embeddings(resume.get("content", ""))
-                match_result = self.match(emb, jd_embedding, resume, jd_data)
+                match_result = self.match(emb, jd_embedding, resume, jd_data,
+                                          base_score=base_score, prepared_jd=prepared_jd)
                 ranked.append((
                     match_result["score"],
                     resume,
@@ -205,4 +342,34 @@ class SemanticMatcher:
                 logger.error(f"Error processing resume: {str(e)}")
                 continue
                 
-        return sorted(ranked, key=lambda x: x[0], reverse=True)
\ No newline at end of file
+        if top_k is not None:
+            return heapq.nlargest(top_k, ranked, key=lambda x: x[0])
+        return sorted(ranked, key=lambda x: x[0], reverse=True)
+
+    def _embed_resumes(self, embedder: Any, contents: List[str],
+                       max_workers: Optional[int] = None) -> List[Optional[Any]]:
+        """Embedding per resume text, or None where it failed.
+        A failed batch is retried text by text so one bad resume only drops itself."""
+        if hasattr(embedder, "generate_embeddings_batch"):
+            try:
+                return list(embedder.generate_embeddings_batch(contents))
+            except Exception as e:
+                logger.warning(f"Batch embedding failed, embedding resumes one by one: {str(e)}")
+        return self._embed_concurrently(embedder, contents, max_workers)
+
+    @staticmethod
+    def _embed_concurrently(embedder: Any, contents: List[str], max_workers: Optional[int] = None) -> List[Optional[Any]]:
+        """Embed texts one by one on a thread pool, keeping input order; None where
+        embedding failed. Model inference runs in native code that releases the GIL."""
+        def embed(content):
+            try:
+                return embedder.generate_embeddings(content)
+            except Exception as e:
+                logger.error(f"Error processing resume: {str(e)}")
+                return None
+
+        workers = min(len(contents), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            return [embed(content) for content in contents]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(embed, contents))
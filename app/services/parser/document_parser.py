@@ -1,18 +1,41 @@
 import os
+import copy
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
 import PyPDF2
 import pdfplumber
 from docx import Document
 from typing import Optional, Dict, Any
+from functools import lru_cache
 import logging
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import docx2txt
+except ImportError:
+    docx2txt = None
+
 logger = logging.getLogger(__name__)
 
+# Number of parsed documents kept per parser, keyed by path, mtime and size
+PARSE_CACHE_SIZE = 128
+
 
 class DocumentParser:
     """Parser for different document formats (PDF, DOCX, TXT)"""
     
     def __init__(self):
         self.supported_extensions = {".pdf", ".docx", ".txt"}
+        
+        # Parsed documents, reused until the file is modified
+        self._parse_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
     
     def parse_document(self, file_path: str) -> Dict[str, Any]:
         """
@@ -24,39 +47,63 @@ class DocumentParser:
         Returns:
             Dictionary containing parsed content and metadata
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            file_stats = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         
         file_extension = os.path.splitext(file_path)[1].lower()
         
         if file_extension not in self.supported_extensions:
             raise ValueError(f"Unsupported file format: {file_extension}")
         
+        # A file whose mtime and size are unchanged is not parsed again
+        key = (file_path, file_stats.st_mtime_ns, file_stats.st_size)
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
             if file_extension == ".pdf":
-                return self._parse_pdf(file_path)
+                result = self._parse_pdf(file_path)
             elif file_extension == ".docx":
-                return self._parse_docx(file_path)
+                result = self._parse_docx(file_path)
             elif file_extension == ".txt":
-                return self._parse_txt(file_path)
+                result = self._parse_txt(file_path)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
         except Exception as e:
             logger.error(f"Error parsing document {file_path}: {str(e)}")
             raise
+        
+        with self._parse_cache_lock:
+            self._parse_cache[key] = result
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return copy.deepcopy(result)
     
     def _parse_pdf(self, file_path: str) -> Dict[str, Any]:
         """Parse PDF document using multiple methods for better extraction"""
-        content = ""
+        # PDFium's native text extraction is much faster than layout analysis
+        if pdfium is not None:
+            try:
+                return self._parse_pdf_pdfium(file_path)
+            except Exception as e:
+                logger.warning(f"pypdfium2 failed, trying pdfplumber: {str(e)}")
+        
+        parts = []
         metadata = {}
         
         try:
-            # Try pdfplumber first (better for complex layouts)
+            # Try pdfplumber next (better for complex layouts)
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
                     text = page.extract_text()
                     if text:
-                        content += text + "\n"
+                        parts.append(text)
                 
                 # Extract metadata
                 if pdf.metadata:
@@ -75,10 +122,11 @@ class DocumentParser:
                 with open(file_path, 'rb') as file:
                     pdf_reader = PyPDF2.PdfReader(file)
                     
+                    parts = []
                     for page in pdf_reader.pages:
                         text = page.extract_text()
                         if text:
-                            content += text + "\n"
+                            parts.append(text)
                     
                     # Extract metadata
                     if pdf_reader.metadata:
@@ -94,41 +142,59 @@ class DocumentParser:
                 raise
         
         return {
-            "content": content.strip(),
+            "content": "\n".join(parts).strip(),
             "metadata": metadata,
             "file_type": "pdf",
             "file_path": file_path
         }
     
-    def _parse_docx(self, file_path: str) -> Dict[str, Any]:
-        """Parse DOCX document"""
+    def _parse_pdf_pdfium(self, file_path: str) -> Dict[str, Any]:
+        """Parse PDF text with pypdfium2 (PDFium's C text extractor)"""
+        parts = []
+        pdf = pdfium.PdfDocument(file_path)
         try:
-            doc = Document(file_path)
-            content = ""
-            
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    content += paragraph.text + "\n"
+            for page in pdf:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if text:
+                    parts.append(text.replace("\r\n", "\n"))
             
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            content += cell.text + "\n"
-            
-            # Extract metadata
+            info = pdf.get_metadata_dict()
             metadata = {
-                "title": doc.core_properties.title or "",
-                "author": doc.core_properties.author or "",
-                "subject": doc.core_properties.subject or "",
-                "creator": doc.core_properties.creator or "",
-                "pages": len(doc.paragraphs)  # Approximate
+                "title": info.get("Title", ""),
+                "author": info.get("Author", ""),
+                "subject": info.get("Subject", ""),
+                "creator": info.get("Creator", ""),
+                "pages": len(pdf)
             }
+        finally:
+            pdf.close()
+        
+        return {
+            "content": "\n".join(parts).strip(),
+            "metadata": metadata,
+            "file_type": "pdf",
+            "file_path": file_path
+        }
+    
+    def _parse_docx(self, file_path: str) -> Dict[str, Any]:
+        """Parse DOCX document"""
+        try:
+            if docx2txt is not None:
+                # docx2txt pulls all text out of document.xml in a single pass
+                text = docx2txt.process(file_path)
+                parts = [line for line in text.splitlines() if line.strip()]
+            else:
+                parts = self._docx_text_parts(Document(file_path))
+            
+            # Metadata comes from the small docProps parts, so the document body
+            # is not parsed a second time
+            metadata = self._docx_metadata(file_path)
             
             return {
-                "content": content.strip(),
+                "content": "\n".join(parts).strip(),
                 "metadata": metadata,
                 "file_type": "docx",
                 "file_path": file_path
@@ -137,11 +203,63 @@ class DocumentParser:
             logger.error(f"Error parsing DOCX file {file_path}: {str(e)}")
             raise
     
+    @staticmethod
+    def _docx_metadata(file_path: str) -> Dict[str, Any]:
+        """Title, author and subject from docProps/core.xml; page count from docProps/app.xml"""
+        properties = {}
+        with zipfile.ZipFile(file_path) as archive:
+            names = set(archive.namelist())
+            for part in ("docProps/core.xml", "docProps/app.xml"):
+                if part in names:
+                    for element in ET.fromstring(archive.read(part)):
+                        properties[element.tag.rsplit("}", 1)[-1]] = (element.text or "").strip()
+        
+        pages = properties.get("Pages", "")
+        return {
+            "title": properties.get("title", ""),
+            "author": properties.get("creator", ""),  # dc:creator, as python-docx's author
+            "subject": properties.get("subject", ""),
+            "creator": "",  # The producing application is not reported for DOCX
+            "pages": int(pages) if pages.isdigit() else 1  # As last saved by the editor
+        }
+    
+    @staticmethod
+    def _docx_text_parts(doc) -> list:
+        """Non-empty paragraph and table cell texts via python-docx"""
+        parts = []
+        
+        # Extract text from paragraphs
+        for paragraph in doc.paragraphs:
+            text = paragraph.text
+            if text.strip():
+                parts.append(text)
+        
+        # Extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    text = cell.text
+                    if text.strip():
+                        parts.append(text)
+        
+        return parts
+    
     def _parse_txt(self, file_path: str) -> Dict[str, Any]:
         """Parse TXT document"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # Read the file once and decode in memory instead of re-reading on failure
+            with open(file_path, 'rb') as file:
+                raw = file.read()
+            
+            try:
+                content = raw.decode('utf-8')
+            except UnicodeDecodeError:
+                # Try with different encoding
+                content = raw.decode('latin-1')
+            
+            # Match the universal-newline translation of text mode
+            if b"\r" in raw:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
             
             metadata = {
                 "title": os.path.basename(file_path),
@@ -157,29 +275,6 @@ class DocumentParser:
                 "file_type": "txt",
                 "file_path": file_path
             }
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    content = file.read()
-                
-                metadata = {
-                    "title": os.path.basename(file_path),
-                    "author": "",
-                    "subject": "",
-                    "creator": "",
-                    "pages": 1
-                }
-                
-                return {
-                    "content": content.strip(),
-                    "metadata": metadata,
-                    "file_type": "txt",
-                    "file_path": file_path
-                }
-            except Exception as e:
-                logger.error(f"Error parsing TXT file {file_path}: {str(e)}")
-                raise
         except Exception as e:
             logger.error(f"Error parsing TXT file {file_path}: {str(e)}")
             raise
@@ -198,4 +293,10 @@ class DocumentParser:
             "file_extension": file_extension,
             "created_time": file_stats.st_ctime,
             "modified_time": file_stats.st_mtime
-        } 
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=None)
+def get_document_parser() -> DocumentParser:
+    """Shared DocumentParser instance"""
+    return DocumentParser()
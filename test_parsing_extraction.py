@@ -1,8 +1,8 @@
-from app.services.parser.document_parser import DocumentParser
-from app.services.extractor.information_extractor import InformationExtractor
+from app.services.parser.document_parser import get_document_parser
+from app.services.extractor.information_extractor import get_information_extractor
 
 # 1. Parse the CV file
-parser = DocumentParser()
+parser = get_document_parser()
 cv_result = parser.parse_document("resumes/Laiba  Idrees-resume.pdf")  # Change to your file path
 
 print("=== Parsed CV Content ===")
@@ -10,7 +10,7 @@ print(cv_result["content"])
 print()
 
 # 2. Extract information from the CV
-extractor = InformationExtractor()
+extractor = get_information_extractor()
 cv_info = extractor.extract_cv_information(cv_result["content"])
 
 print("=== Extracted CV Information ===")
@@ -4,11 +4,11 @@ Test script for regex-only extraction (without LLM)
 """
 
 import logging
-from app.services.extractor.information_extractor import InformationExtractor
-from app.services.parser.document_parser import DocumentParser
+from app.services.extractor.information_extractor import get_information_extractor
+from app.services.parser.document_parser import get_document_parser
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging (WARNING keeps per-call INFO records out of repeated runs)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 def test_regex_only():
@@ -17,8 +17,8 @@ def test_regex_only():
     print("=== Testing Regex-Only Extraction ===")
     
     # Initialize extractor with LLM disabled
-    extractor = InformationExtractor(use_llm_fallback=False)
-    parser = DocumentParser()
+    extractor = get_information_extractor(use_llm_fallback=False)
+    parser = get_document_parser()
     
     print("✓ Initialized extractor with LLM disabled")
     
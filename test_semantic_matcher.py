@@ -1,15 +1,50 @@
 import os
+import hashlib
+import shelve
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pprint import pprint
-from app.services.parser.document_parser import DocumentParser
-from app.services.extractor.information_extractor import InformationExtractor
+from app.services.parser.document_parser import get_document_parser
+from app.services.extractor.information_extractor import get_information_extractor, EXTRACTOR_VERSION
 from app.services.embedding.embedding_generator import EmbeddingGenerator  # Your custom module
 from app.services.matcher.semantic_matcher import SemanticMatcher        # Your custom module
 
+# Resume file types DocumentParser can read
+_RESUME_EXTS = frozenset({".pdf", ".docx", ".txt"})
+
+def _parse_and_extract(filepath):
+    """Parse and extract one CV; each worker process builds its parser/extractor once.
+    Also returns whether the result may be persisted (not after a failed LLM call)."""
+    extractor = get_information_extractor()
+    parsed = get_document_parser().parse_document(filepath)
+    extracted = extractor.extract_cv_information(parsed["content"])
+    cacheable = extractor.is_cached(parsed["content"])
+    extracted["content"] = parsed["content"]  # rank_candidates embeds the CV text
+    return extracted, cacheable
+
+def _file_key(filepath, llm_available):
+    """Cache key for a resume file: hash of its bytes, the extractor version and
+    whether the LLM fallback could run, so regex-only results are redone once it can"""
+    with open(filepath, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f"{digest}:{EXTRACTOR_VERSION}:{'llm' if llm_available else 'regex'}"
+
 def main():
+    resume_dir = "resumes"  # Directory containing CVs (PDF/DOCX)
+    with os.scandir(resume_dir) as entries:
+        filepaths = [
+            entry.path for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _RESUME_EXTS
+        ]
+    # Nothing to rank, so skip loading the spaCy and embedding models
+    if not filepaths:
+        print(f"No resumes found in {resume_dir}")
+        return
+
     # Initialize components
-    parser = DocumentParser()
-    extractor = InformationExtractor()
+    extractor = get_information_extractor()
     embedder = EmbeddingGenerator()  # Uses "all-MiniLM-L6-v2" by default
+    embedder.load_cache("emb_cache.npz")  # Reuse CV embeddings from earlier runs
     matcher = SemanticMatcher()      # Uses weights={"skills": 0.4, "experience": 0.3, ...}
 
     # --- Step 1: Load and process Job Description ---
@@ -21,17 +56,23 @@ def main():
     jd_embedding = embedder.generate_embeddings(jd_text)
 
     # --- Step 2: Load and process Resumes ---
-    resume_dir = "resumes"  # Directory containing CVs (PDF/DOCX)
-    data_list = []
-
-    for file in os.listdir(resume_dir):
-        if file.endswith((".pdf", ".docx", ".txt")):
-            filepath = os.path.join(resume_dir, file)
-          
-            # Parse and extract CV data
-            parsed = parser.parse_document(filepath)
-            extracted = extractor.extract_cv_information(parsed["content"])  # Returns dict (e.g., {"name": "...", "skills": [], ...})
-            data_list.append(extracted)
+    # Parse and extract CVs in parallel processes (e.g., {"name": "...", "skills": [], ...});
+    # files unchanged since an earlier run are served from the on-disk cache
+    with shelve.open("cv_cache") as cv_cache:
+        keys = [_file_key(filepath, extractor.llm_available) for filepath in filepaths]
+        data_list = [cv_cache.get(key) for key in keys]
+        missing = [i for i, data in enumerate(data_list) if data is None]
+        if missing:
+            workers = min(len(missing), os.cpu_count() or 1)
+            # Spawned, not forked: this process already runs ONNX Runtime threads and
+            # possibly a Gemini gRPC channel, which a forked child must not inherit
+            spawn = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+                extracted = pool.map(_parse_and_extract, [filepaths[i] for i in missing], chunksize=4)
+                for i, (data, cacheable) in zip(missing, extracted):
+                    data_list[i] = data
+                    if cacheable:
+                        cv_cache[keys[i]] = data
 
     # --- Step 3: Match and Rank Candidates ---
     ranked_candidates = matcher.rank_candidates(
@@ -40,6 +81,7 @@ def main():
         jd_data=jd_info,
         embedder=embedder
     )
+    embedder.save_cache("emb_cache.npz")
 
     # --- Step 4: Display Results ---
     print("=== Top Candidates ===")